@@ -15,6 +15,7 @@ Usage:
 """
 
 import argparse
+import copy
 import json
 import logging
 import smtplib
@@ -30,6 +31,30 @@ from pathlib import Path
 
 import schedule
 
+# Built once at import; _load_config hands each scheduler its own deep copy
+DEFAULT_CONFIG = {
+    "notifications": {
+        "enabled": False,
+        "smtp_server": "smtp.gmail.com",
+        "smtp_port": 587,
+        "email_from": "",
+        "email_to": [],
+        "email_password": "",
+    },
+    "schedules": {
+        "daily_monitoring": "09:00",
+        "weekly_report": "Monday 08:00",
+        "monthly_quality_check": "1st 07:00",
+        "quarterly_review": "1st of quarter 06:00",
+    },
+    "thresholds": {
+        "high_priority_notify": True,
+        "test_failure_notify": True,
+        "performance_degradation_notify": True,
+    },
+    "output_dirs": {"reports": "automation/reports", "logs": "automation/logs"},
+}
+
 
 class OntologyScheduler:
     """Automated scheduler for ontology monitoring and maintenance."""
@@ -41,28 +66,7 @@ class OntologyScheduler:
 
     def _load_config(self, config_file: str = None) -> dict:
         """Load configuration from file or use defaults."""
-        default_config = {
-            "notifications": {
-                "enabled": False,
-                "smtp_server": "smtp.gmail.com",
-                "smtp_port": 587,
-                "email_from": "",
-                "email_to": [],
-                "email_password": "",
-            },
-            "schedules": {
-                "daily_monitoring": "09:00",
-                "weekly_report": "Monday 08:00",
-                "monthly_quality_check": "1st 07:00",
-                "quarterly_review": "1st of quarter 06:00",
-            },
-            "thresholds": {
-                "high_priority_notify": True,
-                "test_failure_notify": True,
-                "performance_degradation_notify": True,
-            },
-            "output_dirs": {"reports": "automation/reports", "logs": "automation/logs"},
-        }
+        default_config = copy.deepcopy(DEFAULT_CONFIG)
 
         if config_file and Path(config_file).exists():
             try:
@@ -400,28 +404,13 @@ class OntologyScheduler:
 
 def create_sample_config(filename: str):
     """Create a sample configuration file."""
-    sample_config = {
-        "notifications": {
-            "enabled": False,
-            "smtp_server": "smtp.gmail.com",
-            "smtp_port": 587,
-            "email_from": "your-email@gmail.com",
-            "email_to": ["recipient@example.com"],
-            "email_password": "your-app-password",
-        },
-        "schedules": {
-            "daily_monitoring": "09:00",
-            "weekly_report": "monday 08:00",
-            "monthly_quality_check": "1st 07:00",
-            "quarterly_review": "1st of quarter 06:00",
-        },
-        "thresholds": {
-            "high_priority_notify": True,
-            "test_failure_notify": True,
-            "performance_degradation_notify": True,
-        },
-        "output_dirs": {"reports": "automation/reports", "logs": "automation/logs"},
-    }
+    # Same structure as the defaults, with placeholders for the fields users must fill in
+    sample_config = copy.deepcopy(DEFAULT_CONFIG)
+    sample_config["notifications"].update(
+        email_from="your-email@gmail.com",
+        email_to=["recipient@example.com"],
+        email_password="your-app-password",
+    )
 
     with open(filename, "w") as f:
         json.dump(sample_config, f, indent=2)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the ontology loading helpers in utils.common.
+
+The rapper fast path is exercised with _rapper_path and subprocess.run patched,
+so raptor2 does not need to be installed.
+"""
+
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from rdflib import Namespace, URIRef
+from rdflib.namespace import RDF
+
+from utils import common
+from utils.common import (
+    ONTOLOGY_NAMESPACE,
+    TTL_FORMAT,
+    XML_FORMAT,
+    load_ontology_graph,
+)
+
+AWS = Namespace(ONTOLOGY_NAMESPACE)
+
+SAMPLE_TTL = """@prefix : <http://www.semanticweb.org/aws-ontology#> .
+:Database a :Resource .
+"""
+
+
+class TestRapperParse(unittest.TestCase):
+    """The rapper fast path, with the binary and its output faked."""
+
+    # Differs from SAMPLE_TTL so the tests can tell which parser produced a graph
+    RAPPER_NTRIPLES = f"<{AWS.Bucket}> <{RDF.type}> <{AWS.Resource}> .\n".encode()
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.ttl_file = Path(self.tmpdir.name) / "sample.ttl"
+        self.ttl_file.write_text(SAMPLE_TTL, encoding="utf-8")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def load(self, file_path, format, returncode=0):
+        completed = subprocess.CompletedProcess([], returncode, stdout=self.RAPPER_NTRIPLES)
+        with (
+            mock.patch.object(common, "_rapper_path", return_value="/usr/bin/rapper"),
+            mock.patch.object(common.subprocess, "run", return_value=completed) as run,
+        ):
+            graph = load_ontology_graph(file_path, format)
+        return graph, run
+
+    def test_rapper_output_is_used_and_prefixes_rebound(self):
+        graph, run = self.load(self.ttl_file, TTL_FORMAT)
+
+        self.assertEqual(run.call_args.args[0][:5], ["/usr/bin/rapper", "-q", "-i", "turtle", "-o"])
+        self.assertEqual(set(graph), {(AWS.Bucket, RDF.type, AWS.Resource)})
+        self.assertEqual(dict(graph.namespaces())[""], URIRef(ONTOLOGY_NAMESPACE))
+
+    def test_rdfxml_prefixes_rebound(self):
+        owl_file = Path(self.tmpdir.name) / "sample.owl"
+        owl_file.write_text(
+            f'<rdf:RDF xmlns:rdf="{RDF}" xmlns:aws="{ONTOLOGY_NAMESPACE}"/>', encoding="utf-8"
+        )
+        graph, run = self.load(owl_file, XML_FORMAT)
+
+        self.assertIn("rdfxml", run.call_args.args[0])
+        self.assertEqual(dict(graph.namespaces())["aws"], URIRef(ONTOLOGY_NAMESPACE))
+
+    def test_failed_rapper_falls_back_to_rdflib(self):
+        graph, run = self.load(self.ttl_file, TTL_FORMAT, returncode=1)
+
+        run.assert_called_once()
+        self.assertEqual(set(graph), {(AWS.Database, RDF.type, AWS.Resource)})
+
+    def test_formats_rapper_does_not_handle_skip_it(self):
+        nt_file = Path(self.tmpdir.name) / "sample.nt"
+        nt_file.write_text(f"<{AWS.Database}> <{RDF.type}> <{AWS.Resource}> .\n")
+        graph, run = self.load(nt_file, "nt")
+
+        run.assert_not_called()
+        self.assertEqual(len(graph), 1)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -3,7 +3,10 @@
 Test script to ensure OWL and TTL ontology files are semantically synchronized.
 """
 
+import contextlib
+import io
 import sys
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -12,6 +15,7 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from tests.base_test import BaseOntologyTest
+from tools.sync_formats import check_sync_status, convert_owl_to_ttl
 
 try:
     from rdflib import Graph, compare
@@ -196,6 +200,34 @@ class TestFormatSynchronization(BaseOntologyTest):
             f"Different number of data properties: OWL={owl_data_count}, TTL={ttl_data_count}",
         )
 
+    def test_check_sync_status_detects_blank_node_drift(self):
+        """check_sync_status must catch a change that only touches a blank node."""
+        ttl_text = self.ttl_file.read_text(encoding="utf-8")
+        self.assertIn("owl:onProperty :belongsToRegion ]", ttl_text)
+        drifted = ttl_text.replace(
+            "owl:onProperty :belongsToRegion ]", "owl:onProperty :memberOf ]", 1
+        )
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            drifted_ttl = Path(tmpdir) / "aws.ttl"
+            drifted_ttl.write_text(drifted, encoding="utf-8")
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertTrue(check_sync_status(self.owl_file, self.ttl_file))
+                self.assertFalse(check_sync_status(self.owl_file, drifted_ttl))
+
+    def test_owl_to_ttl_uses_default_prefix(self):
+        """Converted Turtle must write ontology terms as :QNames, not full IRIs."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            ttl_out = Path(tmpdir) / "aws.ttl"
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.assertTrue(convert_owl_to_ttl(self.owl_file, ttl_out))
+            ttl_text = ttl_out.read_text(encoding="utf-8")
+
+        self.assertIn("@prefix : <http://www.semanticweb.org/aws-ontology#> .", ttl_text)
+        self.assertIn(":EC2Instance a owl:Class", ttl_text)
+        self.assertNotIn("<http://www.semanticweb.org/aws-ontology#EC2Instance>", ttl_text)
+
 
 def run_sync_test():
     """Run the synchronization test and return results."""
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the ArangoDB import tool's JSONL export and bulk loading.
+
+No database or arangoimport binary is needed: shutil.which and subprocess.run
+are patched and the python-arango database is a mock, so these tests only
+check the documents, the command line and the batching.
+"""
+
+import json
+import subprocess
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from rdflib import BNode, Graph, Literal, Namespace
+from rdflib.namespace import RDF, RDFS, XSD
+
+from tools import import_to_arangodb
+from tools.import_to_arangodb import (
+    _statement_documents,
+    bulk_import_statements,
+    run_arangoimport,
+    write_statements_jsonl,
+)
+
+AWS = Namespace("http://www.semanticweb.org/aws-ontology#")
+
+
+def make_graph() -> Graph:
+    """A small graph with IRI, blank node, plain, typed and language-tagged objects."""
+    graph = Graph()
+    restriction = BNode()
+    graph.add((AWS.Database, RDF.type, AWS.Resource))
+    graph.add((AWS.Database, RDFS.label, Literal("Database Resource", lang="en")))
+    graph.add((AWS.Database, RDFS.subClassOf, restriction))
+    graph.add((restriction, AWS.maxSize, Literal(16, datatype=XSD.integer)))
+    return graph
+
+
+class TestStatementDocuments(unittest.TestCase):
+    """Documents keep term kinds, datatypes and language tags."""
+
+    def setUp(self):
+        docs = list(_statement_documents(make_graph()))
+        self.by_predicate = {doc["predicate"]: doc for doc in docs}
+
+    def test_iri_object(self):
+        doc = self.by_predicate[str(RDF.type)]
+        self.assertEqual(doc["subject"], str(AWS.Database))
+        self.assertEqual(doc["subject_type"], "iri")
+        self.assertEqual(doc["object"], str(AWS.Resource))
+        self.assertEqual(doc["object_type"], "iri")
+        self.assertNotIn("datatype", doc)
+
+    def test_literals_keep_language_and_datatype(self):
+        label = self.by_predicate[str(RDFS.label)]
+        self.assertEqual(label["object_type"], "literal")
+        self.assertEqual(label["lang"], "en")
+
+        size = self.by_predicate[str(AWS.maxSize)]
+        self.assertEqual(size["object"], "16")
+        self.assertEqual(size["datatype"], str(XSD.integer))
+
+    def test_blank_nodes_are_marked(self):
+        link = self.by_predicate[str(RDFS.subClassOf)]
+        size = self.by_predicate[str(AWS.maxSize)]
+        self.assertEqual(link["object_type"], "bnode")
+        self.assertEqual(size["subject_type"], "bnode")
+        self.assertEqual(size["subject"], link["object"])
+
+
+class TestArangoimport(unittest.TestCase):
+    """JSONL export and the arangoimport command line."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.jsonl_file = write_statements_jsonl(make_graph(), Path(self.tmpdir.name) / "out")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_jsonl_has_one_document_per_triple(self):
+        lines = self.jsonl_file.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(self.jsonl_file.name, "statements.jsonl")
+        self.assertEqual(len(lines), 4)
+        self.assertTrue(all("subject" in json.loads(line) for line in lines))
+
+    def test_missing_binary_skips_load(self):
+        with (
+            mock.patch.object(import_to_arangodb.shutil, "which", return_value=None),
+            mock.patch.object(import_to_arangodb.subprocess, "run") as run,
+        ):
+            self.assertTrue(run_arangoimport(self.jsonl_file, "statements"))
+        run.assert_not_called()
+
+    def run_with_binary(self, returncode=0, **kwargs):
+        """Run run_arangoimport against a fake binary; return (ok, options, config)."""
+        seen = {}
+
+        def fake_run(cmd, **run_kwargs):
+            config_file = Path(cmd[cmd.index("--configuration") + 1])
+            seen["config"] = config_file.read_text(encoding="utf-8")
+            seen["mode"] = config_file.stat().st_mode & 0o777
+            seen["config_file"] = config_file
+            return subprocess.CompletedProcess(cmd, returncode, stdout="", stderr="boom")
+
+        with (
+            mock.patch.object(
+                import_to_arangodb.shutil, "which", return_value="/usr/bin/arangoimport"
+            ),
+            mock.patch.object(import_to_arangodb.subprocess, "run", side_effect=fake_run) as run,
+        ):
+            ok = run_arangoimport(self.jsonl_file, "statements", password="pw", **kwargs)
+        cmd = run.call_args.args[0]
+        self.assertFalse(seen["config_file"].exists())
+        return ok, dict(zip(cmd[1::2], cmd[2::2], strict=True)), seen
+
+    def test_command_line(self):
+        ok, options, _ = self.run_with_binary(host="http://db:8529", overwrite=False)
+        self.assertTrue(ok)
+        self.assertEqual(options["--file"], str(self.jsonl_file))
+        self.assertEqual(options["--collection"], "statements")
+        self.assertEqual(options["--overwrite"], "false")
+        self.assertEqual(options["--server.endpoint"], "tcp://db:8529")
+
+    def test_credentials_stay_off_the_command_line(self):
+        _, options, seen = self.run_with_binary()
+        self.assertNotIn("--server.password", options)
+        self.assertNotIn("pw", options.values())
+        self.assertEqual(seen["mode"], 0o600)
+        self.assertIn("password = pw", seen["config"])
+        self.assertIn("username = root", seen["config"])
+
+    def test_missing_password_fails_without_running(self):
+        with (
+            mock.patch.dict(import_to_arangodb.os.environ, clear=True),
+            mock.patch.object(
+                import_to_arangodb.shutil, "which", return_value="/usr/bin/arangoimport"
+            ),
+            mock.patch.object(import_to_arangodb.subprocess, "run") as run,
+            self.assertLogs(level="ERROR"),
+        ):
+            self.assertFalse(run_arangoimport(self.jsonl_file, "statements"))
+        run.assert_not_called()
+
+    def test_https_endpoint_uses_ssl(self):
+        _, options, _ = self.run_with_binary(host="https://db:8529")
+        self.assertEqual(options["--server.endpoint"], "ssl://db:8529")
+
+    def test_failed_import_returns_false(self):
+        ok, _, _ = self.run_with_binary(returncode=1)
+        self.assertFalse(ok)
+
+
+class TestBulkImportStatements(unittest.TestCase):
+    """The python-arango fallback sends documents in batches and counts what was created."""
+
+    def setUp(self):
+        self.db = mock.Mock()
+        self.db.has_collection.return_value = True
+        self.collection = self.db.collection.return_value
+        self.collection.import_bulk.side_effect = lambda batch, **kw: {"created": len(batch)}
+
+    def test_batches_and_created_count(self):
+        with self.assertLogs(level="INFO") as logs:
+            self.assertTrue(bulk_import_statements(self.db, make_graph(), batch_size=3))
+
+        self.collection.truncate.assert_called_once_with()
+        batches = [c.args[0] for c in self.collection.import_bulk.call_args_list]
+        self.assertEqual([len(batch) for batch in batches], [3, 1])
+        self.assertTrue(any("Bulk-imported 4 documents" in line for line in logs.output))
+
+    def test_no_overwrite_keeps_existing_documents(self):
+        self.assertTrue(bulk_import_statements(self.db, make_graph(), overwrite=False))
+        self.collection.truncate.assert_not_called()
+
+    def test_import_error_returns_false(self):
+        self.collection.import_bulk.side_effect = RuntimeError("server down")
+        with self.assertLogs(level="ERROR"):
+            self.assertFalse(bulk_import_statements(self.db, make_graph()))
+
+
+class TestEmitJsonlFallback(unittest.TestCase):
+    """--emit-jsonl bulk-loads through python-arango when arangoimport is missing."""
+
+    def test_python_arango_without_arangordf(self):
+        db = mock.Mock()
+        with (
+            tempfile.TemporaryDirectory() as tmpdir,
+            mock.patch.object(sys, "argv", ["import_to_arangodb.py", "--emit-jsonl", tmpdir]),
+            mock.patch.object(import_to_arangodb, "ARANGO_AVAILABLE", True),
+            mock.patch.object(import_to_arangodb, "ARANGO_RDF_AVAILABLE", False),
+            mock.patch.object(import_to_arangodb, "setup_tool_logging"),
+            mock.patch.object(
+                import_to_arangodb, "load_ontology_data", return_value=(make_graph(), 4)
+            ),
+            mock.patch.object(import_to_arangodb.shutil, "which", return_value=None),
+            mock.patch.object(import_to_arangodb, "connect_to_arangodb", return_value=db),
+            mock.patch.object(
+                import_to_arangodb, "bulk_import_statements", return_value=True
+            ) as bulk_import,
+            self.assertRaises(SystemExit) as exit_info,
+        ):
+            import_to_arangodb.main()
+
+        self.assertEqual(exit_info.exception.code, 0)
+        bulk_import.assert_called_once()
+        self.assertIs(bulk_import.call_args.args[0], db)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the shared logging setup in utils.logging_config.
+
+Each test restores the root logger afterwards so the rest of the suite keeps
+its normal logging configuration.
+"""
+
+import logging
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from utils import logging_config
+from utils.logging_config import (
+    DEFAULT_FORMAT,
+    BufferedFileHandler,
+    _get_formatter,
+    setup_logging,
+)
+
+RECORD_FLAGS = ("logThreads", "logProcesses", "logMultiprocessing", "logAsyncioTasks")
+
+
+class LoggingConfigTestCase(unittest.TestCase):
+    """Saves and restores the root logger around each test."""
+
+    def setUp(self):
+        root = logging.getLogger()
+        self._saved = (root.handlers[:], root.level)
+        self._saved_flags = {flag: getattr(logging, flag, True) for flag in RECORD_FLAGS}
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.log_file = Path(self.tmpdir.name) / "logs" / "tool.log"
+
+    def tearDown(self):
+        logging_config._stop_listener()
+        root = logging.getLogger()
+        for handler in root.handlers:
+            if handler not in self._saved[0]:
+                handler.close()
+        root.handlers, level = self._saved
+        root.setLevel(level)
+        for flag, value in self._saved_flags.items():
+            setattr(logging, flag, value)
+        self.tmpdir.cleanup()
+
+
+class TestAsyncQueue(LoggingConfigTestCase):
+    """With async_queue the root logger only enqueues; a listener does the writes."""
+
+    def test_records_reach_file_once_listener_stops(self):
+        setup_logging(log_file=self.log_file, format_string="%(message)s", async_queue=True)
+
+        root = logging.getLogger()
+        self.assertEqual([type(h) for h in root.handlers], [logging.handlers.QueueHandler])
+
+        logging.getLogger("tool").warning("queued %s", "record")
+        logging_config._stop_listener()
+
+        self.assertIn("queued record", self.log_file.read_text())
+
+    def test_leaving_async_mode_flushes_and_closes_log_file(self):
+        setup_logging(log_file=self.log_file, format_string="%(message)s", async_queue=True)
+        (file_handler,) = [
+            h for h in logging_config._LISTENER.handlers if isinstance(h, BufferedFileHandler)
+        ]
+        logging.getLogger("tool").info("hello")
+
+        setup_logging(level="DEBUG", format_string="%(message)s")
+
+        self.assertIsNone(logging_config._LISTENER)
+        self.assertIsNone(file_handler.stream)
+        self.assertEqual(self.log_file.read_text(), "hello\n")
+
+    def test_synchronous_by_default(self):
+        setup_logging(log_file=self.log_file, format_string="%(message)s")
+
+        self.assertIsNone(logging_config._LISTENER)
+        self.assertNotIn(
+            logging.handlers.QueueHandler, [type(h) for h in logging.getLogger().handlers]
+        )
+
+
+class TestFastFormatters(unittest.TestCase):
+    """The specialized formatters must render exactly like logging.Formatter."""
+
+    def make_record(self):
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            exc_info = sys.exc_info()
+        return logging.LogRecord("tool", logging.ERROR, __file__, 1, "failed %s", ("x",), exc_info)
+
+    def test_matches_stock_formatter(self):
+        for format_string in (DEFAULT_FORMAT, "[sync_formats] %(levelname)s: %(message)s"):
+            with self.subTest(format_string=format_string):
+                fast = _get_formatter(format_string)
+                self.assertIsNot(type(fast), logging.Formatter)
+
+                record = self.make_record()
+                # Same timestamp; the formatter caches exc_text, so start clean
+                stock_record = logging.makeLogRecord({**record.__dict__, "exc_text": None})
+                expected = logging.Formatter(format_string).format(stock_record)
+                self.assertEqual(fast.format(record), expected)
+
+    def test_cached_timestamp_follows_second_boundaries(self):
+        fast, stock = _get_formatter(DEFAULT_FORMAT), logging.Formatter(DEFAULT_FORMAT)
+        for created in (1700000000.25, 1700000000.999, 1700000001.0, 1700000000.5):
+            record = logging.makeLogRecord({"created": created, "msecs": created % 1 * 1000})
+            self.assertEqual(fast.formatTime(record), stock.formatTime(record))
+
+
+class TestRepeatedSetup(LoggingConfigTestCase):
+    """Calling setup_logging again with the same arguments keeps the existing handlers."""
+
+    def test_same_config_is_not_rewired(self):
+        setup_logging(log_file=self.log_file, format_string="%(message)s")
+        handlers = logging.getLogger().handlers[:]
+
+        setup_logging(log_file=self.log_file, format_string="%(message)s")
+        self.assertEqual(logging.getLogger().handlers, handlers)
+
+        setup_logging(level="DEBUG", log_file=self.log_file, format_string="%(message)s")
+        self.assertNotEqual(logging.getLogger().handlers, handlers)
+
+    def test_level_changes_when_root_already_has_handlers(self):
+        setup_logging(level="WARNING", format_string="%(message)s")
+        setup_logging(level="DEBUG", format_string="%(message)s")
+        self.assertEqual(logging.getLogger().level, logging.DEBUG)
+
+    def test_level_aliases(self):
+        for name, expected in (
+            ("warn", logging.WARNING),
+            ("FATAL", logging.CRITICAL),
+            ("NOTSET", logging.NOTSET),
+        ):
+            with self.subTest(level=name):
+                setup_logging(level=name, format_string="%(message)s")
+                self.assertEqual(logging.getLogger().level, expected)
+
+    def test_unknown_level_changes_nothing(self):
+        setup_logging(format_string="%(message)s")
+        flags = {flag: getattr(logging, flag) for flag in RECORD_FLAGS}
+
+        with self.assertRaises(AttributeError):
+            setup_logging(level="LOUD", format_string="%(thread)d %(message)s")
+        self.assertEqual({flag: getattr(logging, flag) for flag in RECORD_FLAGS}, flags)
+
+    def test_reconfiguring_closes_previous_log_file(self):
+        setup_logging(log_file=self.log_file, format_string="%(message)s")
+        (old_file_handler,) = [
+            h for h in logging.getLogger().handlers if isinstance(h, logging.FileHandler)
+        ]
+        logging.getLogger("tool").warning("opens the file")
+        self.assertIsNotNone(old_file_handler.stream)
+
+        setup_logging(level="DEBUG", format_string="%(message)s")
+        self.assertIsNone(old_file_handler.stream)
+
+
+class TestRecordFlags(LoggingConfigTestCase):
+    """Per-record thread/process lookups are only kept when the format uses them."""
+
+    def test_flags_follow_format(self):
+        setup_logging(format_string="%(threadName)s %(message)s")
+        self.assertTrue(logging.logThreads)
+        self.assertFalse(logging.logProcesses)
+
+        setup_logging()
+        self.assertFalse(logging.logThreads)
+        self.assertIsNone(logging.getLogger().makeRecord("t", 20, "f", 1, "m", (), None).thread)
+
+        setup_logging(capture_thread_info=True)
+        self.assertTrue(logging.logThreads)
+        self.assertTrue(logging.logProcesses)
+
+
+class TestBufferedFileHandler(LoggingConfigTestCase):
+    """Log files are written in batches; WARNING and above are flushed immediately."""
+
+    def test_info_is_buffered_until_warning(self):
+        self.log_file.parent.mkdir()
+        handler = BufferedFileHandler(self.log_file, flush_interval=3600)
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger = logging.getLogger("buffered-test")
+        logger.addHandler(handler)
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+        self.addCleanup(logger.removeHandler, handler)
+
+        logger.warning("flushed")
+        logger.info("buffered")
+        self.assertEqual(self.log_file.read_text(), "flushed\n")
+
+        logger.error("error")
+        self.assertEqual(self.log_file.read_text(), "flushed\nbuffered\nerror\n")
+
+        handler.close()
+
+    def test_closed_handler_does_not_reopen_file(self):
+        self.log_file.parent.mkdir()
+        for mode in ("a", "w"):
+            with self.subTest(mode=mode):
+                self.log_file.write_text("kept\n")
+                handler = BufferedFileHandler(self.log_file, mode=mode, delay=True)
+                handler.close()
+
+                handler.handle(logging.makeLogRecord({"msg": "late", "levelno": logging.ERROR}))
+                self.assertIsNone(handler.stream)
+                self.assertEqual(self.log_file.read_text(), "kept\n")
+
+    def test_log_file_is_created_on_first_record(self):
+        setup_logging(log_file=self.log_file, format_string="%(message)s")
+        self.assertFalse(self.log_file.parent.exists())
+
+        logging.getLogger("tool").warning("first")
+        self.assertEqual(self.log_file.read_text(), "first\n")
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the AWS change monitor's offline logic.
+
+The network is never touched: feed fetches are patched so these tests only
+exercise caching, service extraction and priority scoring.
+"""
+
+import json
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add project root to path for imports
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+try:
+    import feedparser  # noqa: F401
+
+    from tools.monitor_aws_changes import AWSChangeMonitor
+
+    FEEDPARSER_AVAILABLE = True
+except ImportError:
+    FEEDPARSER_AVAILABLE = False
+
+
+def make_response(status: int, items=(), headers=None) -> mock.Mock:
+    """Build a fake HTTP response carrying an RSS document with the given (title, link) items."""
+    pub_date = time.strftime("%a, %d %b %Y %H:%M:%S GMT", time.gmtime())
+    body = "".join(
+        f"<item><title>{title}</title><description>Details</description>"
+        f"<link>{link}</link><pubDate>{pub_date}</pubDate></item>"
+        for title, link in items
+    )
+    content = f'<?xml version="1.0"?><rss version="2.0"><channel>{body}</channel></rss>'
+    return mock.Mock(
+        status_code=status,
+        ok=status < 400,
+        content=content.encode(),
+        headers=headers or {},
+    )
+
+
+@unittest.skipUnless(FEEDPARSER_AVAILABLE, "feedparser not available")
+class MonitorTestCase(unittest.TestCase):
+    """Gives each test an AWSChangeMonitor writing to its own temporary directory."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.monitor = AWSChangeMonitor(self.tmpdir.name)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+
+class TestWhatsNewFeedCache(MonitorTestCase):
+    """Conditional GET: a 304 response must be served from the local entry cache."""
+
+    def test_not_modified_reuses_cached_entries(self):
+        fresh = make_response(
+            200,
+            [("Amazon EC2 adds security feature", "https://aws.amazon.com/a")],
+            headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"},
+        )
+        not_modified = make_response(304)
+
+        with mock.patch.object(
+            self.monitor._session, "get", side_effect=[fresh, not_modified]
+        ) as get:
+            first = self.monitor.monitor_whats_new(days=7)
+            second = self.monitor.monitor_whats_new(days=7)
+
+        self.assertEqual(get.call_args_list[1].kwargs["headers"]["If-None-Match"], '"v1"')
+        self.assertEqual(len(first), 1)
+        self.assertEqual(first, second)
+
+    def test_new_only_skips_entries_marked_seen(self):
+        items = [
+            ("Amazon EC2 update", "https://aws.amazon.com/a"),
+            ("Amazon S3 update", "https://aws.amazon.com/b"),
+        ]
+
+        with mock.patch.object(
+            self.monitor._session, "get", side_effect=lambda *a, **kw: make_response(200, items)
+        ):
+            first = self.monitor.monitor_whats_new(days=7, only_new=True)
+            self.monitor.mark_entries_seen()
+            second = self.monitor.monitor_whats_new(days=7, only_new=True)
+            everything = self.monitor.monitor_whats_new(days=7)
+
+        self.assertEqual(len(first), 2)
+        self.assertEqual(second, [])
+        self.assertEqual(everything, first)
+
+
+class TestEntryClassification(MonitorTestCase):
+    """Service extraction uses whole words and aliases; priority uses keyword tiers."""
+
+    def test_short_names_and_aliases(self):
+        services = self.monitor._extract_services(
+            "Amazon EC2 and Amazon Simple Storage Service now support Amazon Aurora exports"
+        )
+        self.assertEqual(sorted(services), ["aurora", "ec2", "s3"])
+
+    def test_names_inside_other_words_are_ignored(self):
+        self.assertEqual(self.monitor._extract_services("A diamond-shaped Rdsx widget"), [])
+
+    def test_priority_tiers(self):
+        self.assertEqual(self.monitor._assess_priority("EC2 deprecates X", ""), "high")
+        self.assertEqual(self.monitor._assess_priority("S3 Preview", "faster reads"), "medium")
+        self.assertEqual(self.monitor._assess_priority("Blog post", "re:Invent recap"), "low")
+
+
+class TestCloudFormationDiff(MonitorTestCase):
+    """The resource cache diff reports both added and removed resource types."""
+
+    def test_added_and_removed_resources(self):
+        current = sorted(self.monitor._get_cf_resource_types())
+        cached = current[1:] + ["AWS::Legacy::Widget"]
+        cache_file = Path(self.tmpdir.name) / "cf_resources_cache.json"
+        cache_file.write_text(json.dumps({"resources": cached}))
+
+        result = self.monitor.monitor_cloudformation_resources()
+
+        self.assertEqual(result["new_resources"], current[:1])
+        self.assertEqual(result["removed_resources"], ["AWS::Legacy::Widget"])
+        self.assertEqual(json.loads(cache_file.read_text())["resources"], current)
+
+
+class TestReport(MonitorTestCase):
+    """The JSON report aggregates changes by priority, service and source."""
+
+    def test_report_counts(self):
+        changes = [
+            {"title": "A", "services": ["ec2", "s3"], "priority": "high", "source": "whats-new"},
+            {"title": "B", "services": ["ec2"], "priority": "low", "source": "whats-new"},
+            {"service": "iam", "status": "monitoring_not_implemented", "source": "api-docs"},
+        ]
+        # Path and str destinations are both accepted
+        output_file = self.monitor.generate_report(changes, Path(self.tmpdir.name) / "r.json")
+        report = json.loads(Path(output_file).read_text())
+
+        self.assertEqual(report["total_changes"], 3)
+        self.assertEqual(report["changes_by_priority"], {"high": 1, "low": 1, "medium": 1})
+        self.assertEqual(report["changes_by_service"], {"ec2": 2, "s3": 1})
+        self.assertEqual(report["changes_by_source"], {"whats-new": 2, "api-docs": 1})
+        self.assertEqual([h["title"] for h in report["high_priority_summary"]], ["A"])
+        self.assertEqual(report["all_changes"], changes)
+
+    def test_non_ascii_is_escaped(self):
+        changes = [{"title": "S3 — café", "priority": "high", "source": "whats-new"}]
+        output_file = self.monitor.generate_report(changes, str(Path(self.tmpdir.name) / "r.json"))
+        text = Path(output_file).read_text(encoding="ascii")
+
+        self.assertIn(r"S3 \u2014 caf\u00e9", text)
+        self.assertEqual(json.loads(text)["all_changes"], changes)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -4,30 +4,51 @@ Import AWS Ontology into ArangoDB using ArangoRDF.
 """
 
 import argparse
+import json
 import logging
 import os
+import shutil
+import subprocess
 import sys
+import tempfile
+from itertools import islice
 from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from rdflib import BNode, Graph, Literal
+
 from utils.common import TTL_FORMAT, get_ontology_files, load_ontology_graph
 from utils.logging_config import setup_tool_logging
 
+# python-arango is enough for connecting and the --emit-jsonl bulk import;
+# ArangoRDF is only needed for the default insert_rdf path
 try:
     from arango import ArangoClient
-    from arango_rdf import ArangoRDF
-    from rdflib import Graph
 
     ARANGO_AVAILABLE = True
 except ImportError as e:
-    logging.error(f"ArangoDB dependencies not available: {e}")
+    logging.error("ArangoDB dependencies not available: %s", e)
     logging.info("Please install: pip install python-arango")
-    logging.info("And ensure ArangoRDF is installed from local clone")
     ARANGO_AVAILABLE = False
 
+try:
+    from arango_rdf import ArangoRDF
+
+    ARANGO_RDF_AVAILABLE = True
+except ImportError as e:
+    logging.error("ArangoRDF not available: %s", e)
+    logging.info("Please ensure ArangoRDF is installed from local clone")
+    ARANGO_RDF_AVAILABLE = False
+
+# Collection targeted by the JSONL export and the verification queries
+STATEMENTS_COLLECTION = "statements"
+
+# Documents per request when bulk-importing through python-arango
+IMPORT_BATCH_SIZE = 10_000
+
 
 def connect_to_arangodb(
     host: str = "http://localhost:8529",
@@ -46,7 +67,7 @@ def connect_to_arangodb(
         return None
 
     try:
-        logging.info(f"Connecting to ArangoDB at {host}...")
+        logging.info("Connecting to ArangoDB at %s...", host)
         client = ArangoClient(hosts=host)
 
         # Connect to system database first
@@ -55,22 +76,26 @@ def connect_to_arangodb(
         # Try to create database
         try:
             db = sys_db.create_database(db_name)
-            logging.info(f"Created new database: {db_name}")
+            logging.info("Created new database: %s", db_name)
         except Exception:
             # Database exists, connect to it
             db = client.db(db_name, username=username, password=password)
-            logging.info(f"Connected to existing database: {db_name}")
+            logging.info("Connected to existing database: %s", db_name)
 
         return db
 
     except Exception as e:
-        logging.error(f"Failed to connect to ArangoDB: {e}")
+        logging.error("Failed to connect to ArangoDB: %s", e)
         logging.info("Make sure ArangoDB is running and credentials are correct")
         return None
 
 
-def load_ontology_data(include_examples: bool = True) -> Graph | None:
-    """Load AWS ontology data."""
+def load_ontology_data(include_examples: bool = True) -> tuple[Graph | None, int]:
+    """Load AWS ontology data.
+
+    Returns:
+        Tuple of (graph, triple_count); graph is None if loading failed
+    """
     logging.info("Loading AWS ontology...")
 
     ttl_file, owl_file, examples_file = get_ontology_files()
@@ -79,44 +104,211 @@ def load_ontology_data(include_examples: bool = True) -> Graph | None:
     ontology_graph = load_ontology_graph(ttl_file, TTL_FORMAT)
     if ontology_graph is None:
         logging.error("Failed to load main ontology")
-        return None
+        return None, 0
+
+    if not include_examples:
+        triple_count = len(ontology_graph)
+        logging.info("Loaded ontology: %d triples", triple_count)
+        return ontology_graph, triple_count
+
+    if logging.getLogger().isEnabledFor(logging.INFO):
+        logging.info("Loaded ontology: %d triples", len(ontology_graph))
+
+    # Load examples
+    examples_graph = load_ontology_graph(examples_file, TTL_FORMAT)
+    if examples_graph is None:
+        logging.error("Failed to load examples")
+        return None, 0
 
-    logging.info(f"Loaded ontology: {len(ontology_graph)} triples")
+    if logging.getLogger().isEnabledFor(logging.INFO):
+        logging.info("Loaded examples: %d triples", len(examples_graph))
 
-    if include_examples:
-        # Load examples
-        examples_graph = load_ontology_graph(examples_file, TTL_FORMAT)
-        if examples_graph is None:
-            logging.error("Failed to load examples")
-            return None
+    # Combine ontology and examples
+    combined_graph = Graph()
+    combined_graph += ontology_graph
+    combined_graph += examples_graph
 
-        logging.info(f"Loaded examples: {len(examples_graph)} triples")
+    # Triples shared by both files are deduplicated, so count the union once
+    triple_count = len(combined_graph)
+    logging.info("Combined total: %d triples", triple_count)
+    return combined_graph, triple_count
 
-        # Combine ontology and examples
-        combined_graph = Graph()
-        combined_graph += ontology_graph
-        combined_graph += examples_graph
 
-        logging.info(f"Combined total: {len(combined_graph)} triples")
-        return combined_graph
+def _prepare_collections(db) -> None:
+    """Pre-create the import target collection so it isn't created lazily per insert.
 
-    return ontology_graph
+    The collection is created with waitForSync disabled and UUID keys; an
+    existing collection is left untouched.
+    """
+    if db.has_collection(STATEMENTS_COLLECTION):
+        return
+    db.create_collection(STATEMENTS_COLLECTION, sync=False, key_generator="uuid")
+    logging.info("Created collection: %s", STATEMENTS_COLLECTION)
 
 
-def import_rdf_data(db, graph: Graph, overwrite: bool = True) -> bool:
+def import_rdf_data(db, graph: Graph, overwrite: bool = True, triple_count: int = None) -> bool:
     """Import RDF data into ArangoDB."""
     try:
         logging.info("Initializing ArangoRDF...")
         arango_rdf = ArangoRDF(db)
 
-        logging.info(f"Importing {len(graph)} triples into ArangoDB...")
+        if triple_count is None:
+            triple_count = len(graph)
+        logging.info("Importing %d triples into ArangoDB...", triple_count)
         arango_rdf.insert_rdf(graph, overwrite=overwrite)
 
         logging.info("Successfully imported RDF data")
         return True
 
     except Exception as e:
-        logging.error(f"Failed to import RDF data: {e}")
+        logging.error("Failed to import RDF data: %s", e)
+        return False
+
+
+def _term_type(term) -> str:
+    """Classify an RDF term as "iri", "bnode" or "literal"."""
+    if isinstance(term, Literal):
+        return "literal"
+    if isinstance(term, BNode):
+        return "bnode"
+    return "iri"
+
+
+def _statement_documents(graph: Graph):
+    """Yield one statement document per triple, in the shape queried by test_queries.
+
+    subject/predicate/object hold the plain term values test_queries filters on.
+    subject_type and object_type record whether each is an IRI, blank node or
+    literal, and literals keep their datatype or language tag, so the export
+    carries the same information as the ArangoRDF import.
+    """
+    for s, p, o in graph:
+        doc = {
+            "subject": str(s),
+            "subject_type": _term_type(s),
+            "predicate": str(p),
+            "object": str(o),
+            "object_type": _term_type(o),
+        }
+        if isinstance(o, Literal):
+            if o.language:
+                doc["lang"] = o.language
+            elif o.datatype:
+                doc["datatype"] = str(o.datatype)
+        yield doc
+
+
+def write_statements_jsonl(graph: Graph, output_dir: Path) -> Path:
+    """Write one JSON document per triple, in the shape queried by test_queries."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    jsonl_file = output_dir / f"{STATEMENTS_COLLECTION}.jsonl"
+
+    count = 0
+    with open(jsonl_file, "w", encoding="utf-8") as f:
+        for doc in _statement_documents(graph):
+            f.write(json.dumps(doc))
+            f.write("\n")
+            count += 1
+
+    logging.info("Wrote %d documents to %s", count, jsonl_file)
+    return jsonl_file
+
+
+def run_arangoimport(
+    jsonl_file: Path,
+    collection: str,
+    host: str = "http://localhost:8529",
+    username: str = "root",
+    password: str = None,
+    db_name: str = "aws_ontology",
+    overwrite: bool = True,
+) -> bool:
+    """Bulk-load a JSONL file with ArangoDB's native arangoimport client."""
+    arangoimport = shutil.which("arangoimport")
+    if arangoimport is None:
+        logging.warning("arangoimport not found on PATH; skipping load")
+        logging.info(
+            "Load it manually with: arangoimport --type jsonl --file %s --collection %s",
+            jsonl_file,
+            collection,
+        )
+        return True
+
+    if password is None:
+        password = os.getenv("ARANGO_PASSWORD")
+    if not password:
+        logging.error(
+            "No ArangoDB password provided. Set the ARANGO_PASSWORD "
+            "environment variable or pass --password."
+        )
+        return False
+
+    # Credentials go in a private config file rather than on the command line,
+    # where any local user could read them from the process list
+    fd, config_file = tempfile.mkstemp(prefix="arangoimport-", suffix=".conf")  # mode 0600
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(f"[server]\nusername = {username}\npassword = {password}\n")
+
+        cmd = [
+            arangoimport,
+            "--configuration",
+            config_file,
+            "--type",
+            "jsonl",
+            "--file",
+            str(jsonl_file),
+            "--collection",
+            collection,
+            "--create-collection",
+            "true",
+            "--overwrite",
+            "true" if overwrite else "false",
+            "--threads",
+            str(os.cpu_count() or 2),
+            "--server.endpoint",
+            host.replace("https://", "ssl://").replace("http://", "tcp://"),
+            "--server.database",
+            db_name,
+        ]
+
+        logging.info("Running arangoimport for %s...", collection)
+        result = subprocess.run(cmd, capture_output=True, text=True)
+    finally:
+        os.unlink(config_file)
+
+    if result.returncode != 0:
+        logging.error("arangoimport failed: %s", result.stderr.strip() or result.stdout.strip())
+        return False
+
+    logging.info("arangoimport completed for %s", collection)
+    return True
+
+
+def bulk_import_statements(
+    db, graph: Graph, overwrite: bool = True, batch_size: int = IMPORT_BATCH_SIZE
+) -> bool:
+    """Load statement documents with python-arango's bulk import.
+
+    Used when arangoimport is not installed. Documents are generated lazily and
+    sent batch_size at a time, one HTTP request per batch.
+    """
+    try:
+        _prepare_collections(db)
+        collection = db.collection(STATEMENTS_COLLECTION)
+        if overwrite:
+            collection.truncate()
+
+        docs = _statement_documents(graph)
+        created = 0
+        while batch := list(islice(docs, batch_size)):
+            created += collection.import_bulk(batch, halt_on_error=True)["created"]
+
+        logging.info("Bulk-imported %d documents into %s", created, STATEMENTS_COLLECTION)
+        return True
+
+    except Exception as e:
+        logging.error("Bulk import failed: %s", e)
         return False
 
 
@@ -131,12 +323,12 @@ def print_database_stats(db):
             if not collection["name"].startswith("_"):
                 count = db.collection(collection["name"]).count()
                 total_docs += count
-                logging.info(f"  {collection['name']}: {count:,} documents")
+                logging.info("  %s: %s documents", collection["name"], f"{count:,}")
 
-        logging.info(f"Total documents: {total_docs:,}")
+        logging.info("Total documents: %s", f"{total_docs:,}")
 
     except Exception as e:
-        logging.error(f"Failed to get statistics: {e}")
+        logging.error("Failed to get statistics: %s", e)
 
 
 def test_queries(db):
@@ -155,7 +347,7 @@ def test_queries(db):
 
         cursor = db.aql.execute(aql)
         aws_classes = list(cursor)
-        logging.info(f"Found {len(aws_classes)} AWS ontology classes")
+        logging.info("Found %d AWS ontology classes", len(aws_classes))
 
         # Query 2: Count example instances
         aql = """
@@ -167,7 +359,7 @@ def test_queries(db):
 
         cursor = db.aql.execute(aql)
         examples = list(cursor)
-        logging.info(f"Found {len(examples)} example instances")
+        logging.info("Found %d example instances", len(examples))
 
         # Query 3: Sample EC2 instances
         aql = """
@@ -180,20 +372,17 @@ def test_queries(db):
 
         cursor = db.aql.execute(aql)
         ec2_instances = list(cursor)
-        logging.info(f"Sample EC2 instances: {len(ec2_instances)}")
+        logging.info("Sample EC2 instances: %d", len(ec2_instances))
 
         return True
 
     except Exception as e:
-        logging.error(f"Test queries failed: {e}")
+        logging.error("Test queries failed: %s", e)
         return False
 
 
 def main():
     """Main function."""
-    if not ARANGO_AVAILABLE:
-        sys.exit(1)
-
     parser = argparse.ArgumentParser(
         description="Import AWS Ontology into ArangoDB using ArangoRDF"
     )
@@ -224,10 +413,25 @@ def main():
 
     parser.add_argument("--test-queries", action="store_true", help="Run test queries after import")
 
+    parser.add_argument(
+        "--emit-jsonl",
+        type=Path,
+        metavar="DIR",
+        help=(
+            "Write statements as JSONL to DIR and load them with arangoimport instead of "
+            "ArangoRDF; without arangoimport on PATH, the same documents are bulk-loaded "
+            "through python-arango and the file is kept as an export only"
+        ),
+    )
+
     parser.add_argument("--verbose", "-v", action="store_true", help="Enable verbose logging")
 
     args = parser.parse_args()
 
+    # The JSONL path loads through arangoimport or python-arango, not ArangoRDF
+    if not (ARANGO_AVAILABLE and ARANGO_RDF_AVAILABLE) and not args.emit_jsonl:
+        sys.exit(1)
+
     # Set up logging
     logger = setup_tool_logging(
         "import_to_arangodb", args.verbose if hasattr(args, "verbose") else False
@@ -237,10 +441,40 @@ def main():
     logger.info("=" * 50)
 
     # Step 1: Load ontology data
-    graph = load_ontology_data(include_examples=not args.no_examples)
+    graph, triple_count = load_ontology_data(include_examples=not args.no_examples)
     if graph is None:
         sys.exit(1)
 
+    if args.emit_jsonl:
+        jsonl_file = write_statements_jsonl(graph, args.emit_jsonl)
+        if shutil.which("arangoimport") is None and ARANGO_AVAILABLE:
+            # No native client: send the same documents through the driver in batches
+            logging.info(
+                "arangoimport not found on PATH; %s is kept as an export only, "
+                "loading through python-arango instead",
+                jsonl_file,
+            )
+            db = connect_to_arangodb(
+                host=args.host,
+                username=args.username,
+                password=args.password,
+                db_name=args.database,
+            )
+            success = db is not None and bulk_import_statements(
+                db, graph, overwrite=not args.no_overwrite
+            )
+        else:
+            success = run_arangoimport(
+                jsonl_file,
+                STATEMENTS_COLLECTION,
+                host=args.host,
+                username=args.username,
+                password=args.password,
+                db_name=args.database,
+                overwrite=not args.no_overwrite,
+            )
+        sys.exit(0 if success else 1)
+
     # Step 2: Connect to ArangoDB
     db = connect_to_arangodb(
         host=args.host, username=args.username, password=args.password, db_name=args.database
@@ -249,7 +483,12 @@ def main():
         sys.exit(1)
 
     # Step 3: Import data
-    success = import_rdf_data(db, graph, overwrite=not args.no_overwrite)
+    try:
+        _prepare_collections(db)
+    except Exception as e:
+        logging.warning("Could not pre-create collections: %s", e)
+
+    success = import_rdf_data(db, graph, overwrite=not args.no_overwrite, triple_count=triple_count)
     if not success:
         sys.exit(1)
 
@@ -262,8 +501,8 @@ def main():
 
     logger.info("Import completed successfully!")
     logger.info("Next steps:")
-    logger.info(f"1. Access ArangoDB web interface: {args.host}")
-    logger.info(f"2. Explore database: {args.database}")
+    logger.info("1. Access ArangoDB web interface: %s", args.host)
+    logger.info("2. Explore database: %s", args.database)
     logger.info("3. Run AQL queries on the imported ontology")
     logger.info("4. See docs/ARANGODB_INTEGRATION.md for query examples")
 
@@ -14,15 +14,19 @@ Usage:
     python tools/monitor_aws_changes.py --source all --output report.json
 """
 
+import calendar
 import json
 import logging
+import os
 import re
 import sys
+import time
+from collections import Counter, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from functools import cached_property, partial
 from pathlib import Path
 
-import feedparser
-
 # Add project root to path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
@@ -30,6 +34,112 @@ sys.path.insert(0, str(project_root))
 from utils.cli_common import create_base_parser, handle_keyboard_interrupt
 from utils.logging_config import setup_tool_logging
 
+WHATS_NEW_FEED_URL = "https://aws.amazon.com/new/feed/"
+USER_AGENT = "aws-ontology-monitor/0.4"
+
+# Seconds to wait for a feed before giving up
+FEED_TIMEOUT = 20
+
+# Upper bound on remembered feed entry IDs for --new-only runs
+MAX_SEEN_IDS = 10_000
+
+# Core services to monitor (from PRD scope)
+CORE_SERVICES = frozenset(
+    {
+        "ec2",
+        "lambda",
+        "s3",
+        "ebs",
+        "rds",
+        "vpc",
+        "iam",
+        "dynamodb",
+        "cloudwatch",
+        "cloudtrail",
+        "aurora",
+    }
+)
+
+# Service aliases and variations
+SERVICE_ALIASES = {
+    "elastic compute cloud": "ec2",
+    "simple storage service": "s3",
+    "elastic block store": "ebs",
+    "relational database service": "rds",
+    "virtual private cloud": "vpc",
+    "identity and access management": "iam",
+    "amazon aurora": "aurora",
+}
+
+# Every keyword that identifies a service, mapped to the canonical service name
+_SERVICE_KEYWORDS = {**{service: service for service in CORE_SERVICES}, **SERVICE_ALIASES}
+
+# Compiled once at import so each text is scanned in a single pass. Longer
+# keywords come first so a phrase wins over a short name at the same position.
+_SERVICE_RE = re.compile(
+    r"\b("
+    + "|".join(re.escape(kw) for kw in sorted(_SERVICE_KEYWORDS, key=len, reverse=True))
+    + r")\b"
+)
+
+# Substring keywords that raise a change's priority (matched anywhere in the text)
+HIGH_PRIORITY_KEYWORDS = (
+    "security",
+    "compliance",
+    "deprecat",
+    "breaking",
+    "critical",
+    "policy",
+    "permission",
+    "access",
+    "authentication",
+    "authorization",
+    "new service",
+    "general availability",
+)
+
+MEDIUM_PRIORITY_KEYWORDS = (
+    "enhancement",
+    "feature",
+    "support",
+    "integration",
+    "update",
+    "improve",
+    "launch",
+    "preview",
+)
+
+_HIGH_PRIORITY_RE = re.compile("|".join(map(re.escape, HIGH_PRIORITY_KEYWORDS)))
+_MEDIUM_PRIORITY_RE = re.compile("|".join(map(re.escape, MEDIUM_PRIORITY_KEYWORDS)))
+
+# Common AWS resource types that might be monitored (placeholder for a real CF listing)
+_CF_SAMPLE_RESOURCES = frozenset(
+    {
+        "AWS::EC2::Instance",
+        "AWS::S3::Bucket",
+        "AWS::IAM::Role",
+        "AWS::IAM::Policy",
+        "AWS::Lambda::Function",
+        "AWS::RDS::DBInstance",
+        "AWS::DynamoDB::Table",
+    }
+)
+
+
+def _dumps(obj, indent: bool = False) -> bytes:
+    """Serialize to UTF-8 JSON bytes for _write_atomic and the report writer."""
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write bytes to a sibling temp file and rename it over path.
+
+    A crash mid-write leaves the previous file intact instead of a truncated one.
+    """
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
 
 class AWSChangeMonitor:
     """Monitor AWS changes from various sources."""
@@ -38,54 +148,94 @@ class AWSChangeMonitor:
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
 
-        # Core services to monitor (from PRD scope)
-        self.core_services = {
-            "ec2",
-            "lambda",
-            "s3",
-            "ebs",
-            "rds",
-            "vpc",
-            "iam",
-            "dynamodb",
-            "cloudwatch",
-            "cloudtrail",
-            "aurora",
-        }
+        self.core_services = CORE_SERVICES
+        self.service_aliases = SERVICE_ALIASES
 
-        # Service aliases and variations
-        self.service_aliases = {
-            "elastic compute cloud": "ec2",
-            "simple storage service": "s3",
-            "elastic block store": "ebs",
-            "relational database service": "rds",
-            "virtual private cloud": "vpc",
-            "identity and access management": "iam",
-            "amazon aurora": "aurora",
-        }
+        # Feed entry IDs reported this run, persisted by mark_entries_seen()
+        self._unseen_entry_ids = []
+
+    @cached_property
+    def _session(self):
+        """One pooled keep-alive session for every HTTP fetch this monitor makes.
+
+        requests is imported here rather than at module level so --help and the
+        offline code paths don't pay for it.
+        """
+        import requests
+        from requests.adapters import HTTPAdapter
+
+        session = requests.Session()
+        session.headers["User-Agent"] = USER_AGENT
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def monitor_whats_new(self, days: int = 7, only_new: bool = False) -> list[dict]:
+        """Monitor AWS What's New RSS feed for recent changes.
+
+        With only_new, entries already recorded by mark_entries_seen() on an
+        earlier run are skipped before any service extraction or scoring.
+        """
+        import feedparser
+        import requests
 
-    def monitor_whats_new(self, days: int = 7) -> list[dict]:
-        """Monitor AWS What's New RSS feed for recent changes."""
         logging.info(f"Monitoring AWS What's New for the last {days} days...")
 
-        feed_url = "https://aws.amazon.com/new/feed/"
+        feed_url = WHATS_NEW_FEED_URL
+        cache = self._load_feed_cache(feed_url)
+
+        headers = {}
+        if cache.get("etag"):
+            headers["If-None-Match"] = cache["etag"]
+        if cache.get("modified"):
+            headers["If-Modified-Since"] = cache["modified"]
+
         try:
-            feed = feedparser.parse(feed_url)
-        except Exception as e:
+            response = self._session.get(feed_url, headers=headers, timeout=FEED_TIMEOUT)
+        except requests.RequestException as e:
             logging.error(f"Error fetching RSS feed: {e}")
             return []
 
-        cutoff_date = datetime.now() - timedelta(days=days)
+        if response.status_code == 304 and "entries" in cache:
+            # Unchanged since the last poll: the server sent no body, reuse our copy
+            logging.info("RSS feed not modified since last fetch, using cached entries")
+            entries = [
+                feedparser.FeedParserDict(
+                    entry,
+                    published_parsed=time.struct_time(entry["published_parsed"])
+                    if entry.get("published_parsed")
+                    else None,
+                )
+                for entry in cache["entries"]
+            ]
+        elif not response.ok:
+            logging.error(f"Error fetching RSS feed: HTTP {response.status_code}")
+            return []
+        else:
+            entries = feedparser.parse(response.content).entries
+            self._save_feed_cache(
+                feed_url,
+                response.headers.get("ETag"),
+                response.headers.get("Last-Modified"),
+                entries,
+            )
+
+        seen_ids = self._load_seen_ids() if only_new else set()
+        # published_parsed is a UTC struct_time, so compare epoch seconds
+        cutoff_ts = time.time() - timedelta(days=days).total_seconds()
         recent_changes = []
 
-        for entry in feed.entries:
+        for entry in entries:
             # Parse entry date; feedparser sets published_parsed to None for
             # malformed/missing dates rather than raising.
             if not entry.get("published_parsed"):
                 continue
-            entry_date = datetime(*entry.published_parsed[:6])
 
-            if entry_date < cutoff_date:
+            entry_id = entry.get("id") or entry.get("link")
+            if entry_id in seen_ids:
+                continue
+            if calendar.timegm(entry.published_parsed) < cutoff_ts:
                 continue
 
             # Extract relevant information
@@ -93,13 +243,15 @@ class AWSChangeMonitor:
                 "title": entry.title,
                 "description": entry.summary,
                 "link": entry.link,
-                "published": entry_date.isoformat(),
+                "published": datetime(*entry.published_parsed[:6]).isoformat(),
                 "services": self._extract_services(entry.title + " " + entry.summary),
                 "priority": self._assess_priority(entry.title, entry.summary),
                 "source": "whats-new",
             }
 
             recent_changes.append(change)
+            if entry_id:
+                self._unseen_entry_ids.append(entry_id)
 
         logging.info(f"Found {len(recent_changes)} recent changes")
         return recent_changes
@@ -112,35 +264,42 @@ class AWSChangeMonitor:
 
         # Get current resource types
         current_resources = self._get_cf_resource_types()
+        now = datetime.now().isoformat()
 
         result = {
             "total_resources": len(current_resources),
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now,
             "new_resources": [],
+            "removed_resources": [],
             "source": "cloudformation",
         }
 
         if compare_with_cache and cache_file.exists():
             try:
-                with open(cache_file) as f:
-                    cached_data = json.load(f)
-
-                cached_resources = set(cached_data.get("resources", []))
-                current_resources_set = set(current_resources)
+                cached_data = json.loads(cache_file.read_bytes())
+                cached_resources = frozenset(cached_data.get("resources", ()))
 
-                new_resources = current_resources_set - cached_resources
-                result["new_resources"] = list(new_resources)
+                new_resources = current_resources - cached_resources
+                removed_resources = cached_resources - current_resources
+                result["new_resources"] = sorted(new_resources)
                 result["new_count"] = len(new_resources)
+                result["removed_resources"] = sorted(removed_resources)
+                result["removed_count"] = len(removed_resources)
 
-                logging.info(f"Found {len(new_resources)} new CloudFormation resource types")
+                logging.info(
+                    f"Found {len(new_resources)} new and {len(removed_resources)} removed "
+                    "CloudFormation resource types"
+                )
             except Exception as e:
                 logging.warning(f"Error comparing with cache: {e}")
 
         # Update cache
-        cache_data = {"resources": current_resources, "last_updated": datetime.now().isoformat()}
+        cache_data = {
+            "resources": sorted(current_resources),
+            "last_updated": now,
+        }
 
-        with open(cache_file, "w") as f:
-            json.dump(cache_data, f, indent=2)
+        _write_atomic(cache_file, _dumps(cache_data))
 
         return result
 
@@ -168,56 +327,44 @@ class AWSChangeMonitor:
         logging.warning("API documentation monitoring requires additional implementation")
         return changes
 
-    def generate_report(self, changes: list[dict], output_file: str = None) -> str:
+    def generate_report(self, changes: list[dict], output_file: str | Path | None = None) -> str:
         """Generate a comprehensive change report."""
+        now = datetime.now()
         if output_file is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            timestamp = now.strftime("%Y%m%d_%H%M%S")
             output_file = str(self.output_dir / f"aws_changes_{timestamp}.json")
 
         # Categorize changes
         report = {
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": now.isoformat(),
             "total_changes": len(changes),
-            "changes_by_priority": {},
-            "changes_by_service": {},
-            "changes_by_source": {},
-            "high_priority_summary": [],
-            "all_changes": changes,
-        }
-
-        # Analyze changes
-        for change in changes:
-            # By priority
-            priority = change.get("priority", "medium")
-            if priority not in report["changes_by_priority"]:
-                report["changes_by_priority"][priority] = 0
-            report["changes_by_priority"][priority] += 1
-
-            # By service
-            services = change.get("services", [])
-            for service in services:
-                if service not in report["changes_by_service"]:
-                    report["changes_by_service"][service] = 0
-                report["changes_by_service"][service] += 1
-
-            # By source
-            source = change.get("source", "unknown")
-            if source not in report["changes_by_source"]:
-                report["changes_by_source"][source] = 0
-            report["changes_by_source"][source] += 1
-
-            # High priority summary
-            if priority == "high":
-                summary = {
+            "changes_by_priority": Counter(c.get("priority", "medium") for c in changes),
+            "changes_by_service": Counter(s for c in changes for s in c.get("services", [])),
+            "changes_by_source": Counter(c.get("source", "unknown") for c in changes),
+            "high_priority_summary": [
+                {
                     "title": change.get("title", "Unknown"),
-                    "services": services,
+                    "services": change.get("services", []),
                     "link": change.get("link", ""),
                 }
-                report["high_priority_summary"].append(summary)
+                for change in changes
+                if change.get("priority", "medium") == "high"
+            ],
+        }
 
-        # Save report
-        with open(output_file, "w") as f:
-            json.dump(report, f, indent=2)
+        # Save report. all_changes is written one change at a time so the whole
+        # report is never held in memory as a single serialized buffer, into a
+        # temp file that only replaces output_file once it is complete.
+        header = _dumps(report, indent=True).rstrip()[:-1].rstrip()
+        output_path = Path(output_file)
+        tmp_file = output_path.with_name(output_path.name + ".tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(header + b',\n  "all_changes": [')
+            for i, change in enumerate(changes):
+                f.write(b",\n    " if i else b"\n    ")
+                f.write(_dumps(change))
+            f.write(b"\n  ]\n}\n" if changes else b"]\n}\n")
+        os.replace(tmp_file, output_file)
 
         logging.info(f"Report saved to: {output_file}")
         return output_file
@@ -231,28 +378,25 @@ class AWSChangeMonitor:
         print(f"\n📊 Change Summary ({len(changes)} total)")
         print("=" * 50)
 
-        # Group by priority
-        by_priority = {}
-        by_service = {}
+        # Count everything, but keep only the few changes that get displayed
+        priority_counts = Counter()
+        service_counts = Counter()
+        shown_by_priority = defaultdict(list)
 
         for change in changes:
             priority = change.get("priority", "medium")
-            services = change.get("services", [])
-
-            if priority not in by_priority:
-                by_priority[priority] = []
-            by_priority[priority].append(change)
+            priority_counts[priority] += 1
+            service_counts.update(change.get("services", []))
 
-            for service in services:
-                if service not in by_service:
-                    by_service[service] = []
-                by_service[service].append(change)
+            shown = shown_by_priority[priority]
+            if len(shown) < 3:  # Show top 3
+                shown.append(change)
 
         # Print by priority
         for priority in ["high", "medium", "low"]:
-            if priority in by_priority:
-                print(f"\n{priority.upper()} Priority ({len(by_priority[priority])} items):")
-                for change in by_priority[priority][:3]:  # Show top 3
+            if priority in priority_counts:
+                print(f"\n{priority.upper()} Priority ({priority_counts[priority]} items):")
+                for change in shown_by_priority[priority]:
                     title = change.get("title", "Unknown")[:80]
                     services = ", ".join(change.get("services", []))
                     print(f"  • {title}")
@@ -260,107 +404,102 @@ class AWSChangeMonitor:
                         print(f"    Services: {services}")
 
         # Print by affected service
-        if by_service:
+        if service_counts:
             print("\nAffected Services:")
-            for service, service_changes in sorted(by_service.items()):
-                print(f"  • {service}: {len(service_changes)} changes")
+            for service, count in sorted(service_counts.items()):
+                print(f"  • {service}: {count} changes")
 
-    def _extract_services(self, text: str) -> list[str]:
-        """Extract AWS service names from text."""
-        text_lower = text.lower()
-        services = set()
-
-        # Direct service name matching
-        for service in self.core_services:
-            if service in text_lower:
-                services.add(service)
-
-        # Service alias matching
-        for alias, service in self.service_aliases.items():
-            if alias in text_lower:
-                services.add(service)
-
-        # Pattern-based matching
-        service_patterns = {
-            r"\bec2\b": "ec2",
-            r"\bs3\b": "s3",
-            r"\biam\b": "iam",
-            r"\bvpc\b": "vpc",
-            r"\brds\b": "rds",
-            r"\bebs\b": "ebs",
-            r"\blambda\b": "lambda",
-            r"\bcloudwatch\b": "cloudwatch",
-            r"\bcloudtrail\b": "cloudtrail",
-            r"\bdynamodb\b": "dynamodb",
+    def _load_feed_cache(self, feed_url: str) -> dict:
+        """Load the cached validators and entries for a feed URL."""
+        cache_file = self.output_dir / "whats_new_cache.json"
+        if not cache_file.exists():
+            return {}
+
+        try:
+            return json.loads(cache_file.read_bytes()).get(feed_url, {})
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable feed cache: {e}")
+            return {}
+
+    def _save_feed_cache(self, feed_url: str, etag: str, modified: str, entries: list) -> None:
+        """Persist a feed's ETag/Last-Modified validators with the entries they describe."""
+        cache_file = self.output_dir / "whats_new_cache.json"
+        cache_data = {
+            feed_url: {
+                "etag": etag,
+                "modified": modified,
+                "entries": [
+                    {
+                        "title": entry.get("title", ""),
+                        "summary": entry.get("summary", ""),
+                        "id": entry.get("id", ""),
+                        "link": entry.get("link", ""),
+                        "published_parsed": list(entry["published_parsed"])
+                        if entry.get("published_parsed")
+                        else None,
+                    }
+                    for entry in entries
+                ],
+            }
         }
 
-        for pattern, service in service_patterns.items():
-            if re.search(pattern, text_lower):
-                services.add(service)
+        try:
+            _write_atomic(cache_file, _dumps(cache_data))
+        except OSError as e:
+            logging.warning(f"Could not write feed cache: {e}")
+
+    def _load_seen_ids(self) -> set[str]:
+        """Load the IDs of feed entries reported by earlier runs."""
+        seen_file = self.output_dir / "seen_ids.json"
+        if not seen_file.exists():
+            return set()
+
+        try:
+            return set(json.loads(seen_file.read_bytes()))
+        except (OSError, ValueError) as e:
+            logging.warning(f"Ignoring unreadable seen-entry list: {e}")
+            return set()
+
+    def mark_entries_seen(self) -> None:
+        """Persist this run's reported entry IDs so --new-only runs skip them next time."""
+        if not self._unseen_entry_ids:
+            return
+
+        seen_file = self.output_dir / "seen_ids.json"
+        previous = []
+        if seen_file.exists():
+            try:
+                previous = json.loads(seen_file.read_bytes())
+            except (OSError, ValueError) as e:
+                logging.warning(f"Ignoring unreadable seen-entry list: {e}")
 
-        return list(services)
+        # dict keeps insertion order, so trimming from the front drops the oldest IDs
+        seen = list(dict.fromkeys(previous + self._unseen_entry_ids))[-MAX_SEEN_IDS:]
+        _write_atomic(seen_file, _dumps(seen))
+        self._unseen_entry_ids = []
+
+    def _extract_services(self, text: str) -> list[str]:
+        """Extract AWS service names from text."""
+        text_lower = text.lower()
+        return list({_SERVICE_KEYWORDS[m.group(1)] for m in _SERVICE_RE.finditer(text_lower)})
 
     def _assess_priority(self, title: str, description: str) -> str:
         """Assess the priority of a change based on content."""
         text = (title + " " + description).lower()
 
-        # High priority keywords
-        high_priority_keywords = [
-            "security",
-            "compliance",
-            "deprecat",
-            "breaking",
-            "critical",
-            "policy",
-            "permission",
-            "access",
-            "authentication",
-            "authorization",
-            "new service",
-            "general availability",
-        ]
-
-        # Medium priority keywords
-        medium_priority_keywords = [
-            "enhancement",
-            "feature",
-            "support",
-            "integration",
-            "update",
-            "improve",
-            "launch",
-            "preview",
-        ]
-
-        # Check for high priority
-        for keyword in high_priority_keywords:
-            if keyword in text:
-                return "high"
-
-        # Check for medium priority
-        for keyword in medium_priority_keywords:
-            if keyword in text:
-                return "medium"
+        if _HIGH_PRIORITY_RE.search(text):
+            return "high"
+
+        if _MEDIUM_PRIORITY_RE.search(text):
+            return "medium"
 
         return "low"
 
-    def _get_cf_resource_types(self) -> list[str]:
+    def _get_cf_resource_types(self) -> frozenset[str]:
         """Get current CloudFormation resource types (placeholder)."""
         # This is a simplified placeholder
         # Real implementation would query CloudFormation documentation or APIs
-
-        # Common AWS resource types that might be monitored
-        sample_resources = [
-            "AWS::EC2::Instance",
-            "AWS::S3::Bucket",
-            "AWS::IAM::Role",
-            "AWS::IAM::Policy",
-            "AWS::Lambda::Function",
-            "AWS::RDS::DBInstance",
-            "AWS::DynamoDB::Table",
-        ]
-
-        return sample_resources
+        return _CF_SAMPLE_RESOURCES
 
 
 @handle_keyboard_interrupt
@@ -384,6 +523,11 @@ def main():
     parser.add_argument(
         "--compare", action="store_true", help="Compare with cached data (for cloudformation)"
     )
+    parser.add_argument(
+        "--new-only",
+        action="store_true",
+        help="Skip entries reported by earlier --new-only runs (for whats-new)",
+    )
 
     args = parser.parse_args()
 
@@ -393,13 +537,26 @@ def main():
     monitor = AWSChangeMonitor()
     all_changes = []
 
+    # Each source is independent and mostly waits on the network, so fetch them
+    # concurrently and merge the results in a fixed order afterwards.
+    tasks = {}
+    if args.source in ["whats-new", "all"]:
+        tasks["whats-new"] = partial(monitor.monitor_whats_new, args.days, args.new_only)
+    if args.source in ["cloudformation", "all"]:
+        tasks["cloudformation"] = partial(monitor.monitor_cloudformation_resources, args.compare)
+    if args.source in ["api-docs", "all"]:
+        tasks["api-docs"] = partial(monitor.monitor_api_docs, args.services)
+
     try:
-        if args.source in ["whats-new", "all"]:
-            changes = monitor.monitor_whats_new(args.days)
-            all_changes.extend(changes)
+        with ThreadPoolExecutor(max_workers=len(tasks)) as executor:
+            futures = {name: executor.submit(task) for name, task in tasks.items()}
+        results = {name: future.result() for name, future in futures.items()}
+
+        if "whats-new" in results:
+            all_changes.extend(results["whats-new"])
 
-        if args.source in ["cloudformation", "all"]:
-            cf_result = monitor.monitor_cloudformation_resources(args.compare)
+        if "cloudformation" in results:
+            cf_result = results["cloudformation"]
             # Convert CF result to change format
             if cf_result.get("new_resources"):
                 cf_change = {
@@ -410,10 +567,23 @@ def main():
                     "source": "cloudformation",
                 }
                 all_changes.append(cf_change)
-
-        if args.source in ["api-docs", "all"]:
-            api_changes = monitor.monitor_api_docs(args.services)
-            all_changes.extend(api_changes)
+            # A resource type disappearing usually means a deprecation
+            if cf_result.get("removed_resources"):
+                all_changes.append(
+                    {
+                        "title": "CloudFormation Resources Removed",
+                        "description": (
+                            f"{len(cf_result['removed_resources'])} resource types "
+                            "are no longer listed"
+                        ),
+                        "removed_resources": cf_result["removed_resources"],
+                        "priority": "high",
+                        "source": "cloudformation",
+                    }
+                )
+
+        if "api-docs" in results:
+            all_changes.extend(results["api-docs"])
 
         # Generate report
         if args.output:
@@ -423,6 +593,10 @@ def main():
         if not args.quiet:
             monitor.print_summary(all_changes)
 
+        # Only remember entries once they have actually been reported
+        if args.new_only:
+            monitor.mark_entries_seen()
+
     except Exception as e:
         print(f"❌ Error during monitoring: {e}")
         return 1
@@ -5,7 +5,6 @@ Setup script for Git hooks in the AWS Ontology project.
 
 import logging
 import shutil
-import stat
 import sys
 from pathlib import Path
 
@@ -16,6 +15,9 @@ sys.path.insert(0, str(project_root))
 from utils.cli_common import create_base_parser, handle_keyboard_interrupt
 from utils.logging_config import setup_tool_logging
 
+# Installed hooks must be executable by git
+HOOK_MODE = 0o755
+
 
 def setup_git_hooks():
     """Set up Git hooks for the project."""
@@ -40,12 +42,9 @@ def setup_git_hooks():
                 dest_file = git_hooks_dir / hook_file.name
 
                 try:
-                    # Copy the hook file
-                    shutil.copy2(hook_file, dest_file)
-
-                    # Make it executable
-                    current_permissions = dest_file.stat().st_mode
-                    dest_file.chmod(current_permissions | stat.S_IEXEC)
+                    # Copy contents only (no metadata), then set the mode once
+                    shutil.copyfile(hook_file, dest_file)
+                    dest_file.chmod(HOOK_MODE)
 
                     logging.info(f"Installed {hook_file.name} hook")
                     hooks_installed += 1
@@ -5,39 +5,62 @@ Ensures both formats contain identical semantic content.
 """
 
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add project root to path for imports
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from utils.cli_common import create_base_parser, handle_keyboard_interrupt
-from utils.common import TTL_FORMAT, XML_FORMAT, get_ontology_files, load_ontology_graph
-from utils.logging_config import setup_tool_logging
-
+# utils.common imports rdflib, so check for it first
 try:
-    from rdflib import Graph
+    from rdflib import BNode, Graph
+    from rdflib.namespace import OWL, PROV, RDFS, SKOS, XSD
 except ImportError:
     print("rdflib not installed. Install with: pip install rdflib")
     sys.exit(1)
 
+from utils.cli_common import create_base_parser, handle_keyboard_interrupt
+from utils.common import (
+    ONTOLOGY_NAMESPACE,
+    TTL_FORMAT,
+    XML_FORMAT,
+    get_ontology_files,
+    load_ontology_graph,
+)
+from utils.logging_config import setup_tool_logging
+
+# Prefixes declared by ontology/aws.ttl. Binding them before serializing keeps
+# the same QNames whichever format the graph was parsed from (RDF/XML does not
+# declare the default ontology prefix) and spares the serializer from deriving
+# prefixes for every term.
+ONTOLOGY_PREFIXES = {
+    "": ONTOLOGY_NAMESPACE,
+    "owl": OWL,
+    "rdfs": RDFS,
+    "xsd": XSD,
+    "prov": PROV,
+    "skos": SKOS,
+}
 
-def convert_ttl_to_owl(ttl_file: Path, owl_file: Path) -> bool:
-    """Convert TTL file to OWL/XML format."""
+
+def _bind_ontology_prefixes(graph: Graph) -> None:
+    """Bind the ontology's declared prefixes, replacing any generated ones."""
+    for prefix, namespace in ONTOLOGY_PREFIXES.items():
+        graph.bind(prefix, namespace, override=True, replace=True)
+
+
+def convert_ttl_to_owl(ttl_file: Path, owl_file: Path, graph: Graph | None = None) -> bool:
+    """Convert TTL file to OWL/XML format, reusing graph if it is already parsed."""
     try:
-        graph = load_ontology_graph(ttl_file, TTL_FORMAT)
+        if graph is None:
+            graph = load_ontology_graph(ttl_file, TTL_FORMAT)
         if graph is None:
             return False
 
-        # Serialize to OWL/XML
-        owl_content = graph.serialize(format="xml")
-
-        # Write to file
-        with open(owl_file, "w", encoding="utf-8") as f:
-            if isinstance(owl_content, bytes):
-                f.write(owl_content.decode("utf-8"))
-            else:
-                f.write(owl_content)
+        # Serialize to OWL/XML, written straight to the file
+        _bind_ontology_prefixes(graph)
+        graph.serialize(destination=str(owl_file), format="xml", encoding="utf-8")
 
         print(f"✅ Converted {ttl_file} → {owl_file}")
         return True
@@ -47,22 +70,17 @@ def convert_ttl_to_owl(ttl_file: Path, owl_file: Path) -> bool:
         return False
 
 
-def convert_owl_to_ttl(owl_file: Path, ttl_file: Path) -> bool:
-    """Convert OWL/XML file to TTL format."""
+def convert_owl_to_ttl(owl_file: Path, ttl_file: Path, graph: Graph | None = None) -> bool:
+    """Convert OWL/XML file to TTL format, reusing graph if it is already parsed."""
     try:
-        graph = load_ontology_graph(owl_file, XML_FORMAT)
+        if graph is None:
+            graph = load_ontology_graph(owl_file, XML_FORMAT)
         if graph is None:
             return False
 
-        # Serialize to TTL
-        ttl_content = graph.serialize(format="turtle")
-
-        # Write to file
-        with open(ttl_file, "w", encoding="utf-8") as f:
-            if isinstance(ttl_content, bytes):
-                f.write(ttl_content.decode("utf-8"))
-            else:
-                f.write(ttl_content)
+        # Serialize to TTL, written straight to the file
+        _bind_ontology_prefixes(graph)
+        graph.serialize(destination=str(ttl_file), format="turtle", encoding="utf-8")
 
         print(f"✅ Converted {owl_file} → {ttl_file}")
         return True
@@ -72,15 +90,45 @@ def convert_owl_to_ttl(owl_file: Path, ttl_file: Path) -> bool:
         return False
 
 
-def check_sync_status(owl_file: Path, ttl_file: Path) -> bool:
-    """Check if OWL and TTL files are synchronized."""
-    try:
-        # Load both files
-        owl_graph = Graph()
-        owl_graph.parse(str(owl_file), format="xml")
+def _split_blank_node_triples(graph: Graph) -> tuple[set, Graph]:
+    """Split a graph into its blank-node-free triples and a subgraph of the rest."""
+    ground = set()
+    bnode_graph = Graph()
+    for triple in graph:
+        if isinstance(triple[0], BNode) or isinstance(triple[2], BNode):
+            bnode_graph.add(triple)
+        else:
+            ground.add(triple)
+    return ground, bnode_graph
+
+
+def _load_if_missing(graph: Graph | None, file_path: Path, format: str) -> Graph | None:
+    """Return graph if given, otherwise load it from file_path."""
+    if graph is not None:
+        return graph
+    return load_ontology_graph(file_path, format)
 
-        ttl_graph = Graph()
-        ttl_graph.parse(str(ttl_file), format="turtle")
+
+def check_sync_status(
+    owl_file: Path,
+    ttl_file: Path,
+    owl_graph: Graph | None = None,
+    ttl_graph: Graph | None = None,
+) -> bool:
+    """Check if OWL and TTL files are synchronized.
+
+    Graphs the caller has already parsed are used as-is; missing ones are loaded.
+    """
+    try:
+        # Load whichever files weren't passed in; the two parses are independent
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            owl_future = executor.submit(_load_if_missing, owl_graph, owl_file, XML_FORMAT)
+            ttl_future = executor.submit(_load_if_missing, ttl_graph, ttl_file, TTL_FORMAT)
+        owl_graph = owl_future.result()
+        ttl_graph = ttl_future.result()
+        if owl_graph is None or ttl_graph is None:
+            print("❌ Failed to check synchronization: could not parse both files")
+            return False
 
         # Compare sizes
         owl_size = len(owl_graph)
@@ -90,13 +138,23 @@ def check_sync_status(owl_file: Path, ttl_file: Path) -> bool:
             print(f"❌ Different number of triples: OWL={owl_size}, TTL={ttl_size}")
             return False
 
-        # Check semantic equivalence
-        from rdflib import compare
+        # Triples without blank nodes must match exactly, which is a plain set
+        # comparison. Only the triples that touch a blank node need canonical
+        # hashing, so the canonicalizer never sees the (much larger) ground part.
+        owl_ground, owl_bnodes = _split_blank_node_triples(owl_graph)
+        ttl_ground, ttl_bnodes = _split_blank_node_triples(ttl_graph)
 
-        if not compare.isomorphic(owl_graph, ttl_graph):
+        if owl_ground != ttl_ground or len(owl_bnodes) != len(ttl_bnodes):
             print("❌ Files are not semantically equivalent")
             return False
 
+        if len(owl_bnodes):
+            from rdflib.compare import to_isomorphic
+
+            if to_isomorphic(owl_bnodes).graph_digest() != to_isomorphic(ttl_bnodes).graph_digest():
+                print("❌ Files are not semantically equivalent")
+                return False
+
         print(f"✅ Files are synchronized ({owl_size} triples each)")
         return True
 
@@ -118,69 +176,81 @@ def sync_formats(direction: str = "ttl_to_owl") -> bool:
         return False
 
 
+def _interactive_sync(ttl_file: Path, owl_file: Path) -> bool:
+    """Check both files and, if they differ, convert in the direction the user picks."""
+    # Parse each file once; the check and whichever conversion follows share them
+    owl_graph = load_ontology_graph(owl_file, XML_FORMAT)
+    ttl_graph = load_ontology_graph(ttl_file, TTL_FORMAT)
+
+    # Check if they're already synchronized
+    if check_sync_status(owl_file, ttl_file, owl_graph, ttl_graph):
+        print("Files are already synchronized!")
+        return True
+
+    print("Files are out of sync. Choose which file to use as source:")
+    print("1. Use TTL as source (convert TTL → OWL)")
+    print("2. Use OWL as source (convert OWL → TTL)")
+
+    choice = input("Enter choice (1 or 2): ").strip()
+
+    if choice == "1":
+        return convert_ttl_to_owl(ttl_file, owl_file, ttl_graph)
+    if choice == "2":
+        return convert_owl_to_ttl(owl_file, ttl_file, owl_graph)
+
+    print("❌ Invalid choice")
+    return False
+
+
+# CLI action -> handler taking (ttl_file, owl_file)
+ACTIONS = {
+    "check": lambda ttl_file, owl_file: check_sync_status(owl_file, ttl_file),
+    "ttl-to-owl": convert_ttl_to_owl,
+    "owl-to-ttl": lambda ttl_file, owl_file: convert_owl_to_ttl(owl_file, ttl_file),
+    "sync": _interactive_sync,
+}
+
+DEFAULT_OWL_PATH = "ontology/aws.owl"
+
+
 @handle_keyboard_interrupt
 def main():
     """Main function."""
-    parser = create_base_parser(
-        "sync_formats", "Synchronize OWL and TTL ontology formats", version="0.4.0"
-    )
+    argv = sys.argv[1:]
 
-    parser.add_argument(
-        "action", choices=["check", "ttl-to-owl", "owl-to-ttl", "sync"], help="Action to perform"
-    )
+    # A bare action with no options (how the pre-commit hook runs "check") is
+    # dispatched directly without building the argument parser.
+    if len(argv) == 1 and argv[0] in ACTIONS:
+        action, owl_path, verbose = argv[0], DEFAULT_OWL_PATH, False
+    else:
+        parser = create_base_parser(
+            "sync_formats", "Synchronize OWL and TTL ontology formats", version="0.4.0"
+        )
 
-    parser.add_argument(
-        "--owl", default="ontology/aws.owl", help="Path to OWL file (default: ontology/aws.owl)"
-    )
+        parser.add_argument("action", choices=list(ACTIONS), help="Action to perform")
 
-    args = parser.parse_args()
+        parser.add_argument(
+            "--owl",
+            default=DEFAULT_OWL_PATH,
+            help=f"Path to OWL file (default: {DEFAULT_OWL_PATH})",
+        )
 
-    # Set up logging
-    setup_tool_logging("sync_formats", args.verbose)
+        args = parser.parse_args(argv)
+        action, owl_path, verbose = args.action, args.owl, args.verbose
 
-    # Resolve paths
-    owl_file = Path(args.owl)
+    # Set up logging
+    setup_tool_logging("sync_formats", verbose)
 
     # Validate files exist for relevant operations
-    if args.action in ["check", "owl-to-ttl", "sync"]:
+    owl_file = Path(owl_path)
+    if action in ["check", "owl-to-ttl", "sync"]:
         if not owl_file.exists():
             print(f"❌ OWL file not found: {owl_file}")
             sys.exit(1)
 
     # Execute action
-    success = True
-
-    if args.action == "check":
-        ttl_file, owl_file, _ = get_ontology_files()
-        success = check_sync_status(owl_file, ttl_file)
-
-    elif args.action == "ttl-to-owl":
-        ttl_file, owl_file, _ = get_ontology_files()
-        success = convert_ttl_to_owl(ttl_file, owl_file)
-
-    elif args.action == "owl-to-ttl":
-        ttl_file, owl_file, _ = get_ontology_files()
-        success = convert_owl_to_ttl(owl_file, ttl_file)
-
-    elif args.action == "sync":
-        # Check if they're already synchronized
-        ttl_file, owl_file, _ = get_ontology_files()
-        if check_sync_status(owl_file, ttl_file):
-            print("Files are already synchronized!")
-        else:
-            print("Files are out of sync. Choose which file to use as source:")
-            print("1. Use TTL as source (convert TTL → OWL)")
-            print("2. Use OWL as source (convert OWL → TTL)")
-
-            choice = input("Enter choice (1 or 2): ").strip()
-
-            if choice == "1":
-                success = convert_ttl_to_owl(ttl_file, owl_file)
-            elif choice == "2":
-                success = convert_owl_to_ttl(owl_file, ttl_file)
-            else:
-                print("❌ Invalid choice")
-                success = False
+    ttl_file, owl_file, _ = get_ontology_files()
+    success = ACTIONS[action](ttl_file, owl_file)
 
     sys.exit(0 if success else 1)
 
@@ -7,7 +7,7 @@ Provides consistent argument parsing and help formatting.
 import argparse
 import sys
 from pathlib import Path
-from typing import Any
+from typing import TypedDict
 
 
 def create_base_parser(
@@ -98,33 +98,48 @@ def add_file_args(parser: argparse.ArgumentParser) -> None:
     file_group.add_argument("--overwrite", action="store_true", help="Overwrite existing files")
 
 
-def validate_args(args: argparse.Namespace) -> dict[str, Any]:
+class ValidatedArgs(TypedDict):
+    """Normalized common options returned by validate_args."""
+
+    verbose: bool
+    quiet: bool
+    output: Path | None
+    overwrite: bool
+
+
+def validate_args(args: argparse.Namespace) -> ValidatedArgs:
     """
     Validate and normalize command line arguments.
 
     Args:
-        args: Parsed arguments from ArgumentParser
+        args: Parsed arguments from a parser built by create_base_parser
 
     Returns:
-        Dictionary of validated arguments
+        The validated common options
 
     Raises:
         SystemExit: If validation fails
     """
-    validated = vars(args).copy()
+    # create_base_parser always defines these; the file options are optional
+    output = getattr(args, "output", None)
+    validated: ValidatedArgs = {
+        "verbose": args.verbose,
+        "quiet": args.quiet,
+        "output": Path(output) if output else None,
+        "overwrite": getattr(args, "overwrite", False),
+    }
 
     # Validate conflicting options
-    if getattr(args, "verbose", False) and getattr(args, "quiet", False):
+    if validated["verbose"] and validated["quiet"]:
         print("Error: --verbose and --quiet are mutually exclusive", file=sys.stderr)
         sys.exit(1)
 
     # Validate file paths
-    if hasattr(args, "output") and args.output:
-        output_path = Path(args.output)
-        if output_path.exists() and not getattr(args, "overwrite", False):
-            print(f"Error: Output file exists: {output_path}", file=sys.stderr)
-            print("Use --overwrite to replace existing files", file=sys.stderr)
-            sys.exit(1)
+    output_path = validated["output"]
+    if output_path is not None and output_path.exists() and not validated["overwrite"]:
+        print(f"Error: Output file exists: {output_path}", file=sys.stderr)
+        print("Use --overwrite to replace existing files", file=sys.stderr)
+        sys.exit(1)
 
     return validated
 
@@ -4,13 +4,172 @@ Logging configuration utilities for the AWS Ontology project.
 Provides consistent logging setup across all modules.
 """
 
+import atexit
 import logging
+import queue
+import re
 import sys
+import time
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
+# Level names accepted by setup_logging, aliases (WARN, FATAL) and NOTSET included
+_LEVEL_MAP = logging.getLevelNamesMapping()
+
+DEFAULT_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# The format setup_tool_logging builds, "[tool] %(levelname)s: %(message)s"
+_TOOL_FORMAT_RE = re.compile(r"\[([^\]%]*)\] %\(levelname\)s: %\(message\)s")
+
+# Loggers handed out by get_logger(), by name
+_LOGGERS: dict[str, logging.Logger] = {}
+
+# Background listener started by setup_logging(async_queue=True), if any
+_LISTENER: QueueListener | None = None
+
+# Arguments and resulting root handlers of the last setup_logging call
+_CURRENT_CONFIG: tuple | None = None
+_CURRENT_HANDLERS: list[logging.Handler] = []
+
+
+def _retire_listener(listener: QueueListener) -> None:
+    """Drain and stop a listener, then close the handlers it was writing to."""
+    listener.stop()
+    for handler in listener.handlers:
+        handler.close()
+
+
+def _stop_listener() -> None:
+    """Stop the background listener, flushing any records still queued."""
+    global _CURRENT_CONFIG, _LISTENER
+    if _LISTENER is not None:
+        _retire_listener(_LISTENER)
+        _LISTENER = None
+        # The queue-only root handlers are useless without it
+        _CURRENT_CONFIG = None
+
+
+atexit.register(_stop_listener)
+
+# Write buffer for log files, and the longest a buffered INFO/DEBUG record may
+# wait before a later record flushes it
+LOG_BUFFER_SIZE = 64 * 1024
+LOG_FLUSH_INTERVAL = 0.5
+
+
+class BufferedFileHandler(logging.FileHandler):
+    """
+    File handler that batches writes instead of flushing after every record.
+
+    Records go into a large write buffer. It is flushed when a WARNING or worse
+    is logged, when a record arrives more than flush_interval seconds after the
+    last flush, and when the handler is closed (logging.shutdown() does this at
+    exit). A hard crash can lose at most one buffer of DEBUG/INFO records.
+    """
+
+    def __init__(
+        self,
+        filename: Path,
+        mode: str = "a",
+        encoding: str = "utf-8",
+        delay: bool = False,
+        buffer_size: int = LOG_BUFFER_SIZE,
+        flush_interval: float = LOG_FLUSH_INTERVAL,
+    ):
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        self._last_flush = time.monotonic()
+        super().__init__(filename, mode=mode, encoding=encoding, delay=delay)
+
+    def _open(self):
+        # Opened on the first record (delay=True), so create the directory then too
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Like FileHandler.emit, but a closed handler never reopens its file,
+        # in any mode: that would leak the descriptor, and with mode="w" also
+        # truncate the log
+        if self._closed:
+            return
+        try:
+            if self.stream is None:
+                self.stream = self._open()
+            self.stream.write(self.format(record) + self.terminator)
+
+            now = time.monotonic()
+            if record.levelno >= logging.WARNING or now - self._last_flush >= self.flush_interval:
+                self.flush()
+                self._last_flush = now
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class FastDefaultFormatter(logging.Formatter):
+    """Formatter for DEFAULT_FORMAT that joins the fields with an f-string.
+
+    Only formatMessage() is replaced; asctime, exception and stack rendering are
+    inherited, so output is identical to logging.Formatter(DEFAULT_FORMAT).
+    """
+
+    def __init__(self, datefmt: str | None = None):
+        super().__init__(DEFAULT_FORMAT, datefmt)
+        # (second, formatted "YYYY-MM-DD HH:MM:SS") for the last record seen.
+        # Swapped as a single tuple so concurrent handlers at worst redo a strftime.
+        self._second_cache: tuple[int, str] = (-1, "")
+
+    def formatTime(self, record: logging.LogRecord, datefmt: str | None = None) -> str:
+        """Format the default timestamp, reusing the date/time part within one second."""
+        if datefmt:
+            return super().formatTime(record, datefmt)
+        second = int(record.created)
+        cached_second, stamp = self._second_cache
+        if second != cached_second:
+            stamp = time.strftime(self.default_time_format, self.converter(second))
+            self._second_cache = (second, stamp)
+        return self.default_msec_format % (stamp, record.msecs)
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        return f"{record.asctime} - {record.name} - {record.levelname} - {record.message}"
+
+
+class FastToolFormatter(logging.Formatter):
+    """Formatter for setup_tool_logging's "[tool] LEVEL: message" lines."""
+
+    def __init__(self, tool_name: str):
+        super().__init__(f"[{tool_name}] %(levelname)s: %(message)s")
+        self._prefix = f"[{tool_name}] "
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        return f"{self._prefix}{record.levelname}: {record.message}"
+
+
+@lru_cache(maxsize=32)
+def _get_formatter(format_string: str) -> logging.Formatter:
+    """Return a shared Formatter for format_string, specialized for the built-in formats."""
+    if format_string == DEFAULT_FORMAT:
+        return FastDefaultFormatter()
+    match = _TOOL_FORMAT_RE.fullmatch(format_string)
+    if match:
+        return FastToolFormatter(match.group(1))
+    return logging.Formatter(format_string)
+
 
 def setup_logging(
-    level: str = "INFO", log_file: Path | None = None, format_string: str | None = None
+    level: str = "INFO",
+    log_file: Path | None = None,
+    format_string: str | None = None,
+    async_queue: bool = False,
+    capture_thread_info: bool = False,
 ) -> logging.Logger:
     """
     Set up structured logging for the application.
@@ -19,31 +178,87 @@ def setup_logging(
         level: Logging level (DEBUG, INFO, WARNING, ERROR)
         log_file: Optional file to write logs to
         format_string: Custom format string for log messages
+        async_queue: Hand records to a background thread that does the console
+            and file writes, so logging calls never block on I/O. Off by
+            default because the tools interleave print() with log output and
+            a background writer can reorder the two.
+        capture_thread_info: Keep recording thread, process and asyncio task
+            details on every LogRecord even when format_string doesn't show
+            them (e.g. for handlers added later with their own formats).
 
     Returns:
         Configured logger instance
     """
+    global _CURRENT_CONFIG, _CURRENT_HANDLERS, _LISTENER
+
     if format_string is None:
-        format_string = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+        format_string = DEFAULT_FORMAT
+
+    # Resolve the level before changing any process-wide state; unknown names
+    # raise AttributeError, as getattr(logging, level) always did
+    level_name = level.upper()
+    level_number = _LEVEL_MAP.get(level_name)
+    if level_number is None:
+        level_number = getattr(logging, level_name)
+
+    # Nothing to do if the root logger is still wired exactly as requested
+    root_logger = logging.getLogger()
+    config = (
+        level_number,
+        str(log_file) if log_file else None,
+        format_string,
+        async_queue,
+        capture_thread_info,
+    )
+    if config == _CURRENT_CONFIG and root_logger.handlers == _CURRENT_HANDLERS:
+        return root_logger
+
+    # Every LogRecord looks up the current thread, process and asyncio task
+    # unless told not to; skip the lookups whose fields the format never shows
+    logging.logThreads = capture_thread_info or "%(thread" in format_string
+    logging.logProcesses = capture_thread_info or "%(process)" in format_string
+    logging.logMultiprocessing = capture_thread_info or "%(processName)" in format_string
+    logging.logAsyncioTasks = capture_thread_info or "%(taskName)" in format_string
 
-    # Configure root logger
-    logging.basicConfig(level=getattr(logging, level.upper()), format=format_string, handlers=[])
+    # Set the level directly: basicConfig() does nothing once the root logger
+    # has handlers, so a second call could never change the level
+    root_logger.setLevel(level_number)
 
     # Add console handler
+    formatter = _get_formatter(format_string)
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(logging.Formatter(format_string))
+    console_handler.setFormatter(formatter)
 
     # Add file handler if specified
     handlers = [console_handler]
     if log_file:
-        log_file.parent.mkdir(parents=True, exist_ok=True)
-        file_handler = logging.FileHandler(log_file)
-        file_handler.setFormatter(logging.Formatter(format_string))
+        # Nothing touches the filesystem until the first record is logged
+        file_handler = BufferedFileHandler(log_file, delay=True)
+        file_handler.setFormatter(formatter)
         handlers.append(file_handler)
 
+    listener = None
+    if async_queue:
+        log_queue = queue.SimpleQueue()
+        listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        listener.start()
+        handlers = [QueueHandler(log_queue)]
+
     # Configure root logger with handlers
-    root_logger = logging.getLogger()
+    old_listener, old_handlers = _LISTENER, _CURRENT_HANDLERS
     root_logger.handlers = handlers
+    _LISTENER = listener
+    _CURRENT_CONFIG = config
+    _CURRENT_HANDLERS = list(handlers)
+
+    # Only now retire what the previous call installed, so records logged by
+    # other threads meanwhile still reach a handler that writes them out.
+    # Closing releases its log file; handlers attached by anyone else are
+    # replaced but left open.
+    if old_listener is not None:
+        _retire_listener(old_listener)
+    for handler in old_handlers:
+        handler.close()
 
     return root_logger
 
@@ -58,7 +273,12 @@ def get_logger(name: str) -> logging.Logger:
     Returns:
         Logger instance
     """
-    return logging.getLogger(name)
+    # logging.getLogger() takes the module lock on every call; loggers are never
+    # discarded, so a plain dict lookup returns the same object without it
+    logger = _LOGGERS.get(name)
+    if logger is None:
+        logger = _LOGGERS[name] = logging.getLogger(name)
+    return logger
 
 
 def setup_tool_logging(tool_name: str, verbose: bool = False) -> logging.Logger: